@@ -19,6 +19,19 @@ from infinity_grid.models.configuration import (
 from .framework.base_test_manager import BaseIntegrationTestManager, ExchangeTestConfig
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the blocking sleeps of the exchange adapter and strategies."""
+    for target in (
+        "infinity_grid.adapters.exchanges.kraken.sleep",
+        "infinity_grid.strategies.grid_base.sleep",
+        "infinity_grid.strategies.grid_hodl.sleep",
+        "infinity_grid.strategies.grid_sell.sleep",
+        "infinity_grid.strategies.swing.sleep",
+    ):
+        monkeypatch.setattr(target, lambda *_args, **_kwargs: None)
+
+
 @pytest.fixture(scope="session")
 def notification_config() -> NotificationConfigDTO:
     return NotificationConfigDTO(telegram=TelegramConfigDTO(token=None, chat_id=None))
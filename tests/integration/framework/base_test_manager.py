@@ -505,25 +505,32 @@ class BaseIntegrationTestManager(ABC):
     ) -> None:
         """
         Check if the current orders are matching the expected ones.
+
+        The orders are materialized once and compared column-wise, so that a
+        mismatch reports all expected and actual values of the affected column.
         """
-        for order, price, volume, side in zip(
-            orders or self.strategy._orderbook_table.get_orders().all(),
-            prices,
-            volumes,
-            sides,
-            strict=True,
-        ):
-            assert order.price == price, f"Expected price {price}, got {order.price}"
-            assert (
-                order.volume == volume
-            ), f"Expected volume {volume}, got {order.volume}"
-            assert order.side == side, f"Expected side {side}, got {order.side}"
-            assert (
-                order.symbol == self.exchange_config.pair
-            ), f"Expected symbol {self.exchange_config.pair}, got {order.symbol}"
-            assert (
-                order.userref == self.strategy._config.userref
-            ), f"Expected userref {self.strategy._config.userref}, got {order.userref}"
+        orders = tuple(orders or self.strategy._orderbook_table.get_orders().all())
+
+        prices, volumes, sides = tuple(prices), tuple(volumes), tuple(sides)
+
+        actual_prices = tuple(o.price for o in orders)
+        assert actual_prices == prices, f"Expected prices {prices}, got {actual_prices}"
+        actual_volumes = tuple(o.volume for o in orders)
+        assert (
+            actual_volumes == volumes
+        ), f"Expected volumes {volumes}, got {actual_volumes}"
+        actual_sides = tuple(o.side for o in orders)
+        assert actual_sides == sides, f"Expected sides {sides}, got {actual_sides}"
+        actual_symbols = {o.symbol for o in orders}
+        assert actual_symbols <= {self.exchange_config.pair}, (
+            f"Expected symbol {self.exchange_config.pair} for all orders,"
+            f" got {actual_symbols}"
+        )
+        actual_userrefs = {o.userref for o in orders}
+        assert actual_userrefs <= {self.strategy._config.userref}, (
+            f"Expected userref {self.strategy._config.userref} for all orders,"
+            f" got {actual_userrefs}"
+        )
 
     # =========================================================================
     # Internal helper methods
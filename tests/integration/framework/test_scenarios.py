@@ -240,35 +240,19 @@ class IntegrationTestScenarios:
         )
 
         # Test buy order shifting behavior on price increase and sell order execution
-        base_balance_before = float(
-            self.manager._mock_api.get_balances()[
-                self.manager.exchange_config.base_currency
-            ]["balance"],
-        )
-        quote_balance_before = float(
-            self.manager._mock_api.get_balances()[
-                self.manager.exchange_config.quote_currency
-            ]["balance"],
-        )
+        base_currency = self.manager.exchange_config.base_currency
+        quote_currency = self.manager.exchange_config.quote_currency
 
+        balances_before = self.manager._mock_api.get_balances()
         await self.scenario_shift_buy_orders_up(test_data.trigger_shift_up_buy_orders)
+        balances_after = self.manager._mock_api.get_balances()
 
         # Ensure that profit has been made (sell orders executed)
-        assert (
-            float(
-                self.manager._mock_api.get_balances()[
-                    self.manager.exchange_config.base_currency
-                ]["balance"],
-            )
-            < base_balance_before
-        )
-        assert (
-            float(
-                self.manager._mock_api.get_balances()[
-                    self.manager.exchange_config.quote_currency
-                ]["balance"],
-            )
-            > quote_balance_before
+        assert float(balances_after[base_currency]["balance"]) < float(
+            balances_before[base_currency]["balance"],
+        )
+        assert float(balances_after[quote_currency]["balance"]) > float(
+            balances_before[quote_currency]["balance"],
         )
 
         # Check handling of insufficient funds for selling
@@ -237,13 +237,14 @@ class KrakenMockAPI(Market, Trade, User, MockExchangeAPI):
                 },
             )
 
+        last_price = Decimal(last)
         for txid, order in self.get_open_orders()["open"].items():
             if (
                 order["descr"]["type"] == "buy"
-                and Decimal(order["descr"]["price"]) >= Decimal(last)
+                and Decimal(order["descr"]["price"]) >= last_price
             ) or (
                 order["descr"]["type"] == "sell"
-                and Decimal(order["descr"]["price"]) <= Decimal(last)
+                and Decimal(order["descr"]["price"]) <= last_price
             ):
                 await fill_order(txid=txid)
 
@@ -14,7 +14,6 @@ tested independently, providing better modularity and test isolation.
 
 import logging
 from typing import Callable
-from unittest import mock
 
 import pytest
 
@@ -226,8 +225,6 @@ CDCA_AAPLXUSD_EXPECTATIONS = CDCATestData(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -237,8 +234,6 @@ CDCA_AAPLXUSD_EXPECTATIONS = CDCATestData(
     ids=["XBTUSD", "AAPLxUSD"],
 )
 async def test_cdca(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.MagicMock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
     test_manager_factory: Callable,
     symbol: str,
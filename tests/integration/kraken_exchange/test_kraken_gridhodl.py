@@ -14,7 +14,6 @@ tested independently, providing better modularity and test isolation.
 
 import logging
 from typing import Callable
-from unittest import mock
 
 import pytest
 
@@ -343,9 +342,6 @@ GRIDHODL_AAPLXUSD_EXPECTATIONS = GridHODLTestData(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_hodl.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -355,9 +351,6 @@ GRIDHODL_AAPLXUSD_EXPECTATIONS = GridHODLTestData(
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_gridhodl(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.MagicMock,  # noqa: ARG001
-    mock_sleep3: mock.MagicMock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
     test_manager_factory: Callable,
     symbol: str,
@@ -440,9 +433,6 @@ GRIDHODL_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = GridHODLUnfilledSurplusTestDat
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_hodl.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -452,9 +442,6 @@ GRIDHODL_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = GridHODLUnfilledSurplusTestDat
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_grid_hodl_unfilled_surplus(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.Mock,  # noqa: ARG001
-    mock_sleep3: mock.Mock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
     test_manager_factory: pytest.FixtureRequest,
     symbol: str,
@@ -5,13 +5,6 @@
 # https://github.com/btschwertfeger
 #
 
-# -*- mode: python; coding: utf-8 -*-
-#
-# Copyright (C) 2025 Benjamin Thomas Schwertfeger
-# All rights reserved.
-# https://github.com/btschwertfeger
-#
-
 """
 Integration tests for the GridSell strategy on Kraken exchange using the testing framework.
 
@@ -21,7 +14,6 @@ replacing the previous direct test implementation with a more structured approac
 
 import logging
 from collections.abc import Callable
-from unittest import mock
 
 import pytest
 
@@ -365,9 +357,6 @@ GRIDSELL_AAPLXUSD_EXPECTATIONS = GridSellTestData(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_sell.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -377,11 +366,8 @@ GRIDSELL_AAPLXUSD_EXPECTATIONS = GridSellTestData(
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_grid_sell(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.MagicMock,  # noqa: ARG001
-    mock_sleep3: mock.MagicMock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
-    test_manager_factory: Callable[[str, str], KrakenIntegrationTestManager],
+    test_manager_factory: Callable[..., KrakenIntegrationTestManager],
     symbol: str,
     test_data: GridSellTestData,
 ) -> None:
@@ -484,9 +470,6 @@ GRIDSELL_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = GridSellUnfilledSurplusTestDat
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_sell.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -496,11 +479,8 @@ GRIDSELL_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = GridSellUnfilledSurplusTestDat
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_grid_sell_unfilled_surplus(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.Mock,  # noqa: ARG001
-    mock_sleep3: mock.Mock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
-    test_manager_factory: Callable[[str, str], KrakenIntegrationTestManager],
+    test_manager_factory: Callable[..., KrakenIntegrationTestManager],
     symbol: str,
     test_data: GridSellUnfilledSurplusTestData,
 ) -> None:
@@ -522,6 +502,9 @@ async def test_grid_sell_unfilled_surplus(
     test_manager = test_manager_factory("Kraken", symbol, strategy="GridSell")
     await test_manager.initialize_engine()
     scenarios = IntegrationTestScenarios(test_manager)
+    strategy = test_manager.strategy
+    mock_api = test_manager._mock_api
+    userref = strategy._config.userref
 
     # ==========================================================================
     # INITIALIZATION AND SETUP
@@ -537,16 +520,13 @@ async def test_grid_sell_unfilled_surplus(
     # 2. BUYING PARTLY FILLED and ensure that the unfilled surplus is handled
     LOG.info("******* Check partially filled orders *******")
 
-    test_manager._mock_api.fill_order(
-        test_manager.strategy._orderbook_table.get_orders().first().txid,
+    mock_api.fill_order(
+        strategy._orderbook_table.get_orders(limit=1).first().txid,
         test_data.partial_fill.fill_volume,
     )
-    assert (
-        test_manager.strategy._orderbook_table.count()
-        == test_data.partial_fill.n_open_orders
-    )
+    assert strategy._orderbook_table.count() == test_data.partial_fill.n_open_orders
 
-    balances = test_manager._mock_api.get_balances()
+    balances = mock_api.get_balances()
     assert (
         float(balances[test_manager.exchange_config.base_currency]["balance"])
         == test_data.partial_fill.expected_base_balance
@@ -555,18 +535,16 @@ async def test_grid_sell_unfilled_surplus(
         balances[test_manager.exchange_config.quote_currency]["balance"],
     ) == pytest.approx(test_data.partial_fill.expected_quote_balance)
 
-    test_manager.strategy._handle_cancel_order(
-        test_manager.strategy._orderbook_table.get_orders().first().txid,
+    strategy._handle_cancel_order(
+        strategy._orderbook_table.get_orders(limit=1).first().txid,
     )
 
+    configuration = strategy._configuration_table.get()
     assert (
-        test_manager.strategy._configuration_table.get()["vol_of_unfilled_remaining"]
-        == test_data.partial_fill.fill_volume
+        configuration["vol_of_unfilled_remaining"] == test_data.partial_fill.fill_volume
     )
     assert (
-        test_manager.strategy._configuration_table.get()[
-            "vol_of_unfilled_remaining_max_price"
-        ]
+        configuration["vol_of_unfilled_remaining_max_price"]
         == test_data.partial_fill.vol_of_unfilled_remaining_max_price
     )
 
@@ -577,58 +555,53 @@ async def test_grid_sell_unfilled_surplus(
     #    partly filled order.
     LOG.info("******* Check selling the unfilled surplus *******")
 
-    test_manager.strategy.new_buy_order(
+    strategy.new_buy_order(
         order_price=test_data.sell_partial_fill.order_price,
     )
     assert (
-        test_manager.strategy._orderbook_table.count()
-        == test_data.sell_partial_fill.n_open_orders
+        strategy._orderbook_table.count() == test_data.sell_partial_fill.n_open_orders
     )
     assert (
         len(
             [
                 o
-                for o in test_manager.rest_api.get_open_orders(
-                    userref=test_manager.strategy._config.userref,
-                )
+                for o in test_manager.rest_api.get_open_orders(userref=userref)
                 if o.status == "open"
             ],
         )
         == test_data.sell_partial_fill.n_open_orders
     )
 
-    order = test_manager.strategy._orderbook_table.get_orders(
+    order = strategy._orderbook_table.get_orders(
         filters={"price": test_data.sell_partial_fill.order_price},
-    ).all()[0]
-    test_manager._mock_api.fill_order(
+        limit=1,
+    ).first()
+    mock_api.fill_order(
         order["txid"],
         test_data.partial_fill.fill_volume,
     )
-    test_manager.strategy._handle_cancel_order(order["txid"])
+    strategy._handle_cancel_order(order["txid"])
 
     assert (
         len(
             [
                 o
-                for o in test_manager.rest_api.get_open_orders(
-                    userref=test_manager.strategy._config.userref,
-                )
+                for o in test_manager.rest_api.get_open_orders(userref=userref)
                 if o.status == "open"
             ],
         )
         == test_data.sell_partial_fill.n_open_orders
     )
     assert (
-        test_manager.strategy._configuration_table.get()[
-            "vol_of_unfilled_remaining_max_price"
-        ]
+        strategy._configuration_table.get()["vol_of_unfilled_remaining_max_price"]
         == 0.0
     )
 
-    sell_orders = test_manager.strategy._orderbook_table.get_orders(
+    sell_order = strategy._orderbook_table.get_orders(
         filters={"side": "sell"},
-    ).all()
-    assert sell_orders[0].price == test_data.sell_partial_fill.expected_sell_price
-    assert sell_orders[0].volume == pytest.approx(
+        limit=1,
+    ).first()
+    assert sell_order.price == test_data.sell_partial_fill.expected_sell_price
+    assert sell_order.volume == pytest.approx(
         test_data.sell_partial_fill.expected_sell_volume,
     )
@@ -14,7 +14,6 @@ tested independently, providing better modularity and test isolation.
 
 import logging
 from typing import Callable
-from unittest import mock
 
 import pytest
 
@@ -267,9 +266,6 @@ SWING_AAPLXUSD_EXPECTATIONS = SWINGTestData(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.swing.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -279,9 +275,6 @@ SWING_AAPLXUSD_EXPECTATIONS = SWINGTestData(
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_swing(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.MagicMock,  # noqa: ARG001
-    mock_sleep3: mock.MagicMock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
     test_manager_factory: Callable,
     symbol: str,
@@ -408,9 +401,6 @@ SWING_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = SWINGUnfilledSurplusTestData(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-@mock.patch("infinity_grid.adapters.exchanges.kraken.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.swing.sleep", return_value=None)
-@mock.patch("infinity_grid.strategies.grid_base.sleep", return_value=None)
 @pytest.mark.parametrize(
     ("symbol", "test_data"),
     [
@@ -420,9 +410,6 @@ SWING_UNFILLED_SURPLUS_AAPLXUSD_EXPECTATIONS = SWINGUnfilledSurplusTestData(
     ids=("BTCUSD", "AAPLxUSD"),
 )
 async def test_swing_unfilled_surplus(
-    mock_sleep1: mock.MagicMock,  # noqa: ARG001
-    mock_sleep2: mock.MagicMock,  # noqa: ARG001
-    mock_sleep3: mock.MagicMock,  # noqa: ARG001
     caplog: pytest.LogCaptureFixture,
     test_manager_factory: Callable,
     symbol: str,
@@ -442,6 +429,8 @@ async def test_swing_unfilled_surplus(
     test_manager = test_manager_factory("Kraken", symbol, strategy="SWING")
     await test_manager.initialize_engine()
     scenarios = IntegrationTestScenarios(test_manager)
+    base_currency = test_manager.exchange_config.base_currency
+    quote_currency = test_manager.exchange_config.quote_currency
 
     # Initialize and prepare for trading
     await scenarios.scenario_prepare_for_trading(test_data.initial_ticker)
@@ -455,27 +444,28 @@ async def test_swing_unfilled_surplus(
     # Check initial balances (SWING creates initial sell order)
     balances = test_manager._mock_api.get_balances()
 
-    assert float(
-        balances[test_manager.exchange_config.base_currency]["balance"],
-    ) == pytest.approx(test_data.initial_balances.expected_base_balance)
-    assert float(
-        balances[test_manager.exchange_config.base_currency]["hold_trade"],
-    ) == pytest.approx(test_data.initial_balances.expected_base_hold)
-    assert float(
-        balances[test_manager.exchange_config.quote_currency]["balance"],
-    ) == pytest.approx(test_data.initial_balances.expected_quote_balance)
-    assert float(
-        balances[test_manager.exchange_config.quote_currency]["hold_trade"],
-    ) == pytest.approx(test_data.initial_balances.expected_quote_hold)
+    base = balances[base_currency]
+    quote = balances[quote_currency]
+    assert (
+        float(base["balance"]),
+        float(base["hold_trade"]),
+        float(quote["balance"]),
+        float(quote["hold_trade"]),
+    ) == pytest.approx(
+        (
+            test_data.initial_balances.expected_base_balance,
+            test_data.initial_balances.expected_base_hold,
+            test_data.initial_balances.expected_quote_balance,
+            test_data.initial_balances.expected_quote_hold,
+        ),
+    )
 
     # ==========================================================================
     # 2. BUYING PARTLY FILLED and ensure that the unfilled surplus is handled
     # correctly.
     LOG.info("******* Check handling of unfilled surplus *******")
-    test_manager._mock_api.fill_order(
-        test_manager.strategy._orderbook_table.get_orders().first().txid,
-        test_data.partial_fill.fill_volume,
-    )
+    txid = test_manager.strategy._orderbook_table.get_orders(limit=1).first().txid
+    test_manager._mock_api.fill_order(txid, test_data.partial_fill.fill_volume)
     assert (
         test_manager.strategy._orderbook_table.count()
         == test_data.partial_fill.n_open_orders
@@ -484,32 +474,31 @@ async def test_swing_unfilled_surplus(
     # Check balances after partial fill
     balances = test_manager._mock_api.get_balances()
 
-    assert float(
-        balances[test_manager.exchange_config.base_currency]["balance"],
-    ) == pytest.approx(test_data.partial_fill_balances.expected_base_balance)
-    assert float(
-        balances[test_manager.exchange_config.base_currency]["hold_trade"],
-    ) == pytest.approx(test_data.partial_fill_balances.expected_base_hold)
-    assert float(
-        balances[test_manager.exchange_config.quote_currency]["balance"],
-    ) == pytest.approx(test_data.partial_fill_balances.expected_quote_balance)
-    assert float(
-        balances[test_manager.exchange_config.quote_currency]["hold_trade"],
-    ) == pytest.approx(test_data.partial_fill_balances.expected_quote_hold)
+    base = balances[base_currency]
+    quote = balances[quote_currency]
+    assert (
+        float(base["balance"]),
+        float(base["hold_trade"]),
+        float(quote["balance"]),
+        float(quote["hold_trade"]),
+    ) == pytest.approx(
+        (
+            test_data.partial_fill_balances.expected_base_balance,
+            test_data.partial_fill_balances.expected_base_hold,
+            test_data.partial_fill_balances.expected_quote_balance,
+            test_data.partial_fill_balances.expected_quote_hold,
+        ),
+    )
 
     # Cancel the partially filled order to trigger unfilled surplus handling
-    test_manager.strategy._handle_cancel_order(
-        test_manager.strategy._orderbook_table.get_orders().first().txid,
-    )
+    test_manager.strategy._handle_cancel_order(txid)
 
+    configuration = test_manager.strategy._configuration_table.get()
     assert (
-        test_manager.strategy._configuration_table.get()["vol_of_unfilled_remaining"]
-        == test_data.partial_fill.fill_volume
+        configuration["vol_of_unfilled_remaining"] == test_data.partial_fill.fill_volume
     )
     assert (
-        test_manager.strategy._configuration_table.get()[
-            "vol_of_unfilled_remaining_max_price"
-        ]
+        configuration["vol_of_unfilled_remaining_max_price"]
         == test_data.partial_fill.vol_of_unfilled_remaining_max_price
     )
 
@@ -542,7 +531,8 @@ async def test_swing_unfilled_surplus(
     # Partially fill and cancel the new order to trigger surplus selling
     order = test_manager.strategy._orderbook_table.get_orders(
         filters={"price": test_data.sell_partial_fill.order_price},
-    ).all()[0]
+        limit=1,
+    ).first()
     test_manager._mock_api.fill_order(order["txid"], test_data.partial_fill.fill_volume)
     test_manager.strategy._handle_cancel_order(order["txid"])
 
@@ -566,11 +556,11 @@ async def test_swing_unfilled_surplus(
     )
 
     # Verify the sell order for unfilled surplus was created
-    sell_orders = test_manager.strategy._orderbook_table.get_orders(
+    sell_order = test_manager.strategy._orderbook_table.get_orders(
         filters={"side": "sell", "id": 7},
-    ).all()
-    assert sell_orders[0].price == test_data.sell_partial_fill.expected_sell_price
-    assert sell_orders[0].volume == pytest.approx(
+    ).first()
+    assert sell_order.price == test_data.sell_partial_fill.expected_sell_price
+    assert sell_order.volume == pytest.approx(
         test_data.sell_partial_fill.expected_sell_volume,
     )
 
@@ -20,29 +20,34 @@ from infinity_grid.interfaces.exchange import (
 )
 
 EXCHANGES = ("Kraken",)  # needs to be extended when more exchanges are added
+KRAKEN_LAZY_ARGS = (
+    "infinity_grid.adapters.exchanges.kraken",
+    "KrakenExchangeRESTServiceAdapter",
+    "KrakenExchangeWebsocketServiceAdapter",
+)
+
+
+@pytest.fixture
+def lazy_adapter() -> _LazyAdapter:
+    """A fresh, not yet loaded lazy adapter for Kraken."""
+    return _LazyAdapter(*KRAKEN_LAZY_ARGS)
 
 
 class TestExchangeAdapterRegistry:
     """Tests for the ExchangeAdapterRegistry class."""
 
     @pytest.mark.parametrize("exchange_name", EXCHANGES)
-    def test_adapters_registered(self: Self, exchange_name: str) -> None:
-        """Test that Kraken adapters are automatically registered."""
+    def test_adapters_registered_and_typed(self: Self, exchange_name: str) -> None:
+        """Test that adapters are registered and implement the interfaces."""
         assert exchange_name in ExchangeAdapterRegistry.get_supported_exchanges()
 
-    @pytest.mark.parametrize("exchange_name", EXCHANGES)
-    def test_get_rest_adapter(self: Self, exchange_name: str) -> None:
-        """Test getting a REST adapter."""
-        adapter = ExchangeAdapterRegistry.get_rest_adapter(exchange_name)
-        assert adapter is not None
-        assert issubclass(adapter, IExchangeRESTService)
+        rest_adapter = ExchangeAdapterRegistry.get_rest_adapter(exchange_name)
+        assert rest_adapter is not None
+        assert issubclass(rest_adapter, IExchangeRESTService)
 
-    @pytest.mark.parametrize("exchange_name", EXCHANGES)
-    def test_get_websocket_adapter(self: Self, exchange_name: str) -> None:
-        """Test getting a WebSocket adapter."""
-        adapter = ExchangeAdapterRegistry.get_websocket_adapter(exchange_name)
-        assert adapter is not None
-        assert issubclass(adapter, IExchangeWebSocketService)
+        ws_adapter = ExchangeAdapterRegistry.get_websocket_adapter(exchange_name)
+        assert ws_adapter is not None
+        assert issubclass(ws_adapter, IExchangeWebSocketService)
 
     def test_unsupported_exchange_rest(self: Self) -> None:
         """Test that requesting an unsupported exchange raises ValueError."""
@@ -68,126 +73,111 @@ class TestExchangeAdapterRegistry:
 class TestLazyLoading:
     """Tests for lazy loading functionality of the registry."""
 
-    def test_lazy_adapter_initialization(self: Self) -> None:
+    def test_lazy_adapter_initialization(
+        self: Self,
+        lazy_adapter: _LazyAdapter,
+    ) -> None:
         """Test that LazyAdapter can be initialized without importing."""
-        lazy = _LazyAdapter(
-            "infinity_grid.adapters.exchanges.kraken",
-            "KrakenExchangeRESTServiceAdapter",
-            "KrakenExchangeWebsocketServiceAdapter",
-        )
         # Testing internal state is acceptable in unit tests
-        assert lazy._rest_adapter is None
-        assert lazy._websocket_adapter is None
+        assert lazy_adapter._rest_adapter is None
+        assert lazy_adapter._websocket_adapter is None
 
-    def test_lazy_adapter_loads_on_demand(self: Self) -> None:
+    def test_lazy_adapter_loads_on_demand(
+        self: Self,
+        lazy_adapter: _LazyAdapter,
+    ) -> None:
         """Test that adapters are loaded only when requested."""
-        lazy = _LazyAdapter(
-            "infinity_grid.adapters.exchanges.kraken",
-            "KrakenExchangeRESTServiceAdapter",
-            "KrakenExchangeWebsocketServiceAdapter",
-        )
-
         # First call should load and cache
-        rest_adapter = lazy.get_rest_adapter()
+        rest_adapter = lazy_adapter.get_rest_adapter()
         assert rest_adapter is not None
-        assert lazy._rest_adapter is not None
+        assert lazy_adapter._rest_adapter is not None
         assert issubclass(rest_adapter, IExchangeRESTService)
 
         # Second call should return cached version
-        rest_adapter_2 = lazy.get_rest_adapter()
+        rest_adapter_2 = lazy_adapter.get_rest_adapter()
         assert rest_adapter_2 is rest_adapter
 
-    def test_lazy_adapter_websocket_loads_on_demand(self: Self) -> None:
+    def test_lazy_adapter_websocket_loads_on_demand(
+        self: Self,
+        lazy_adapter: _LazyAdapter,
+    ) -> None:
         """Test that WebSocket adapters are loaded only when requested."""
-        lazy = _LazyAdapter(
-            "infinity_grid.adapters.exchanges.kraken",
-            "KrakenExchangeRESTServiceAdapter",
-            "KrakenExchangeWebsocketServiceAdapter",
-        )
-
-        ws_adapter = lazy.get_websocket_adapter()
+        ws_adapter = lazy_adapter.get_websocket_adapter()
         assert ws_adapter is not None
-        assert lazy._websocket_adapter is not None
+        assert lazy_adapter._websocket_adapter is not None
         assert issubclass(ws_adapter, IExchangeWebSocketService)
 
-    def test_lazy_registration(self: Self) -> None:
+    def test_lazy_registration(self: Self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test lazy registration of exchange adapters."""
-        # Save and restore registry state to avoid side effects
-        original_adapters = ExchangeAdapterRegistry._adapters.copy()
-
-        try:
-            ExchangeAdapterRegistry.register_lazy(
-                "TestExchange",
-                "infinity_grid.adapters.exchanges.kraken",
-                "KrakenExchangeRESTServiceAdapter",
-                "KrakenExchangeWebsocketServiceAdapter",
-            )
-
-            assert "TestExchange" in ExchangeAdapterRegistry.get_supported_exchanges()
-            adapter = ExchangeAdapterRegistry._adapters["TestExchange"]
-            assert isinstance(adapter, _LazyAdapter)
-
-        finally:
-            # Restore original state
-            ExchangeAdapterRegistry._adapters = original_adapters
-
-    def test_lazy_adapter_import_error(self: Self) -> None:
-        """Test that ImportError is raised with helpful message when module fails to load."""
-        # Save and restore registry state to avoid side effects
-        original_adapters = ExchangeAdapterRegistry._adapters.copy()
+        # Work on a copy of the registry that is restored after the test
+        monkeypatch.setattr(
+            ExchangeAdapterRegistry,
+            "_adapters",
+            dict(ExchangeAdapterRegistry._adapters),
+        )
 
-        try:
-            ExchangeAdapterRegistry.register_lazy(
-                "FakeExchange",
-                "non_existent_module",
-                "FakeRESTAdapter",
-                "FakeWSAdapter",
-            )
+        ExchangeAdapterRegistry.register_lazy(
+            "TestExchange",
+            *KRAKEN_LAZY_ARGS,
+        )
+
+        assert "TestExchange" in ExchangeAdapterRegistry.get_supported_exchanges()
+        adapter = ExchangeAdapterRegistry._adapters["TestExchange"]
+        assert isinstance(adapter, _LazyAdapter)
+
+    def test_lazy_adapter_import_error(
+        self: Self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that ImportError is raised with helpful message when module fails to load."""
+        # Work on a copy of the registry that is restored after the test
+        monkeypatch.setattr(
+            ExchangeAdapterRegistry,
+            "_adapters",
+            dict(ExchangeAdapterRegistry._adapters),
+        )
 
-            with pytest.raises(ImportError, match="Failed to load REST adapter"):
-                ExchangeAdapterRegistry.get_rest_adapter("FakeExchange")
+        ExchangeAdapterRegistry.register_lazy(
+            "FakeExchange",
+            "non_existent_module",
+            "FakeRESTAdapter",
+            "FakeWSAdapter",
+        )
 
-            with pytest.raises(ImportError, match="Failed to load WebSocket adapter"):
-                ExchangeAdapterRegistry.get_websocket_adapter("FakeExchange")
+        with pytest.raises(ImportError, match="Failed to load REST adapter"):
+            ExchangeAdapterRegistry.get_rest_adapter("FakeExchange")
 
-        finally:
-            # Restore original state
-            ExchangeAdapterRegistry._adapters = original_adapters
+        with pytest.raises(ImportError, match="Failed to load WebSocket adapter"):
+            ExchangeAdapterRegistry.get_websocket_adapter("FakeExchange")
 
-    def test_eager_registration(self: Self) -> None:
+    def test_eager_registration(self: Self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test eager registration still works for non-optional dependencies."""
         # Create mock adapters
         mock_rest = MagicMock(spec=IExchangeRESTService)
         mock_ws = MagicMock(spec=IExchangeWebSocketService)
 
-        # Save and restore registry state to avoid side effects
-        original_adapters = ExchangeAdapterRegistry._adapters.copy()
-
-        try:
-            ExchangeAdapterRegistry.register(
-                "EagerExchange",
-                mock_rest,
-                mock_ws,
-            )
-
-            assert "EagerExchange" in ExchangeAdapterRegistry.get_supported_exchanges()
-            adapter = ExchangeAdapterRegistry._adapters["EagerExchange"]
-            assert isinstance(adapter, tuple)
-            assert adapter[0] is mock_rest
-            assert adapter[1] is mock_ws
-
-            # Verify we can retrieve them
-            assert (
-                ExchangeAdapterRegistry.get_rest_adapter("EagerExchange") is mock_rest
-            )
-            assert (
-                ExchangeAdapterRegistry.get_websocket_adapter("EagerExchange")
-                is mock_ws
-            )
-
-        finally:
-            # Restore original state
-            ExchangeAdapterRegistry._adapters = original_adapters
+        # Work on a copy of the registry that is restored after the test
+        monkeypatch.setattr(
+            ExchangeAdapterRegistry,
+            "_adapters",
+            dict(ExchangeAdapterRegistry._adapters),
+        )
+
+        ExchangeAdapterRegistry.register(
+            "EagerExchange",
+            mock_rest,
+            mock_ws,
+        )
+
+        assert "EagerExchange" in ExchangeAdapterRegistry.get_supported_exchanges()
+        adapter = ExchangeAdapterRegistry._adapters["EagerExchange"]
+        assert isinstance(adapter, tuple)
+        assert adapter[0] is mock_rest
+        assert adapter[1] is mock_ws
+
+        # Verify we can retrieve them
+        assert ExchangeAdapterRegistry.get_rest_adapter("EagerExchange") is mock_rest
+        assert ExchangeAdapterRegistry.get_websocket_adapter("EagerExchange") is mock_ws
 
     def test_kraken_uses_lazy_loading(self: Self) -> None:
         """Test that Kraken is registered with lazy loading."""
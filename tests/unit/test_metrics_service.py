@@ -14,6 +14,8 @@ testing the HTTP server functionality, endpoints, and error handling.
 
 import json
 import logging
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -26,6 +28,23 @@ from infinity_grid.exceptions import MetricsServerError
 from infinity_grid.models.configuration import MetricsConfigDTO
 from infinity_grid.services.metrics_service import MetricsServer
 
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+EXPECTED_STATUS = {
+    "state": "RUNNING",
+    "uptime_seconds": pytest.approx(100.0, abs=1.0),
+    "timestamp": "2025-01-01T12:00:00+00:00",
+}
+
+EXPECTED_ROOT = {
+    "endpoints": {
+        "/": "This help message",
+        "/status": "Current bot status",
+    },
+    "bot_state": "RUNNING",
+    "timestamp": "2025-01-01T12:00:00+00:00",
+}
+
 
 class TestMetricsServer:
     """Test cases for MetricsServer"""
@@ -53,6 +72,15 @@ class TestMetricsServer:
             verbosity=1,
         )
 
+    @pytest.fixture
+    def patched_web(self) -> Iterator[tuple[MagicMock, MagicMock]]:
+        """Patch aiohttp's AppRunner and TCPSite used by the metrics server."""
+        with (
+            patch("infinity_grid.services.metrics_service.web.AppRunner") as runner,
+            patch("infinity_grid.services.metrics_service.web.TCPSite") as site,
+        ):
+            yield runner, site
+
     def test_setup_routes(self, metrics_server: MetricsServer) -> None:
         """Test route setup creates application with correct routes."""
         app = metrics_server._setup_routes()
@@ -68,55 +96,41 @@ class TestMetricsServer:
     async def test_status_handler_success(self, metrics_server: MetricsServer) -> None:
         """Test successful status endpoint response."""
         request = make_mocked_request("GET", "/status")
+        metrics_server._start_time = time.time() - 100.0
 
-        with patch("time.time", return_value=1000.0):
-            metrics_server._start_time = 900.0
-
-            mock_datetime = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            with patch("infinity_grid.services.metrics_service.datetime") as mock_dt:
-                mock_dt.now.return_value = mock_datetime
+        with patch("infinity_grid.services.metrics_service.datetime") as mock_dt:
+            mock_dt.now.return_value = FROZEN_NOW
 
-                response = await metrics_server._status_handler(request)
+            response = await metrics_server._status_handler(request)
 
         assert response.status == 200
         assert response.content_type == "application/json"
 
-        response_data = json.loads(response.text)
-        assert response_data["state"] == "RUNNING"
-        assert response_data["uptime_seconds"] == 100.0
-        assert response_data["timestamp"] == "2025-01-01T12:00:00+00:00"
+        assert json.loads(response.text) == EXPECTED_STATUS
 
     @pytest.mark.asyncio
     async def test_root_handler_success(self, metrics_server: MetricsServer) -> None:
         """Test successful root endpoint response."""
         request = make_mocked_request("GET", "/")
 
-        mock_datetime = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         with patch("infinity_grid.services.metrics_service.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_datetime
+            mock_dt.now.return_value = FROZEN_NOW
 
             response = await metrics_server._root_handler(request)
 
         assert response.status == 200
         assert response.content_type == "application/json"
 
-        response_data = json.loads(response.text)
-        assert "endpoints" in response_data
-        assert response_data["endpoints"]["/"] == "This help message"
-        assert response_data["endpoints"]["/status"] == "Current bot status"
-        assert response_data["bot_state"] == "RUNNING"
-        assert response_data["timestamp"] == "2025-01-01T12:00:00+00:00"
+        assert json.loads(response.text) == EXPECTED_ROOT
 
     @pytest.mark.asyncio
-    @patch("infinity_grid.services.metrics_service.web.TCPSite")
-    @patch("infinity_grid.services.metrics_service.web.AppRunner")
     async def test_start_success(
         self,
-        mock_app_runner: MagicMock,
-        mock_tcp_site: MagicMock,
         metrics_server: MetricsServer,
+        patched_web: tuple[MagicMock, MagicMock],
     ) -> None:
         """Test successful server start."""
+        mock_app_runner, mock_tcp_site = patched_web
         mock_runner_instance = AsyncMock()
         mock_app_runner.return_value = mock_runner_instance
 
@@ -143,15 +157,13 @@ class TestMetricsServer:
         mock_log.info.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("infinity_grid.services.metrics_service.web.TCPSite")
-    @patch("infinity_grid.services.metrics_service.web.AppRunner")
     async def test_start_failure(
         self,
-        mock_app_runner: MagicMock,
-        mock_tcp_site: MagicMock,  # noqa: ARG002
         metrics_server: MetricsServer,
+        patched_web: tuple[MagicMock, MagicMock],
     ) -> None:
         """Test server start failure handling."""
+        mock_app_runner, _ = patched_web
         mock_runner_instance = AsyncMock()
         mock_app_runner.return_value = mock_runner_instance
         mock_runner_instance.setup.side_effect = Exception("Setup failed")
@@ -160,25 +172,27 @@ class TestMetricsServer:
             await metrics_server.start()
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("initialized", [True, False])
     async def test_stop_success(
         self,
         metrics_server: MetricsServer,
         caplog: pytest.LogCaptureFixture,
+        initialized: bool,
     ) -> None:
-        """Test successful server stop."""
+        """Test successful server stop with and without initialized components."""
         caplog.set_level(logging.INFO)
         mock_site = AsyncMock()
         mock_runner = AsyncMock()
-        mock_app = Mock()
 
-        metrics_server._site = mock_site
-        metrics_server._runner = mock_runner
-        metrics_server._app = mock_app
+        if initialized:
+            metrics_server._site = mock_site
+            metrics_server._runner = mock_runner
+            metrics_server._app = Mock()
 
         await metrics_server.stop()
 
-        mock_site.stop.assert_called_once()
-        mock_runner.cleanup.assert_called_once()
+        assert mock_site.stop.call_count == int(initialized)
+        assert mock_runner.cleanup.call_count == int(initialized)
 
         assert metrics_server._site is None
         assert metrics_server._runner is None
@@ -195,18 +209,3 @@ class TestMetricsServer:
 
         with pytest.raises(MetricsServerError, match="Failed to stop metrics server"):
             await metrics_server.stop()
-
-    @pytest.mark.asyncio
-    async def test_stop_with_no_components(
-        self,
-        metrics_server: MetricsServer,
-        caplog: pytest.LogCaptureFixture,
-    ) -> None:
-        """Test stopping server when no components are initialized."""
-        caplog.set_level(logging.INFO)
-        metrics_server._site = None
-        metrics_server._runner = None
-        metrics_server._app = None
-
-        await metrics_server.stop()
-        assert "Metrics server stopped successfully" in caplog.text